@@ -56,7 +56,7 @@ MIDDLEWARE = [
 ]
 
 CORS_ALLOW_ALL_ORIGINS = True
-CORS_ALLOW_METHODS = ['GET', 'POST', 'OPTIONS']
+CORS_ALLOW_METHODS = ['GET', 'POST', 'PATCH', 'OPTIONS']
 CORS_ALLOW_HEADERS = ['*']
 
 ROOT_URLCONF = 'backend.urls'
@@ -89,10 +89,22 @@ if RENDER:
 else:
     DB_PATH = BASE_DIR /'.data'/'db.sqlite3'
 
+# Point at another SQLite file, e.g. the temporary database used by load_test.py
+DB_PATH = os.environ.get('TASKS_DB_PATH', DB_PATH)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': DB_PATH,
+        'OPTIONS': {
+            # Take the write lock when a transaction starts. A deferred transaction that
+            # reads first fails with "database is locked" when it later upgrades to write.
+            'transaction_mode': 'IMMEDIATE',
+        },
+        # A file (not shared-cache memory) so tests see real SQLite write locking
+        'TEST': {
+            'NAME': Path(DB_PATH).parent / 'test_db.sqlite3',
+        },
     }
 }
 
@@ -103,7 +103,7 @@ async function analyze() {
   try {
     const strat = strategySelect.value;
 
-    const res = await fetch(`${API_BASE}/analyze/?strategy=${strat}`, {
+    const res = await fetch(`${API_BASE}/analyze/?strategy=${strat}&explain=1`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(tasks)
@@ -155,7 +155,7 @@ async function suggest() {
   // Fetch suggestions from server
   try {
 
-    const res = await fetch(`${API_BASE}/suggest/`);
+    const res = await fetch(`${API_BASE}/suggest/?explain=1`);
     // Await response
     const data = await res.json();
 
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+"""
+HTTP load test: boots gunicorn against a temporary SQLite database, seeds it,
+drives mixed /analyze/ and /suggest/ traffic and prints latency percentiles as JSON.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+STRATEGIES = ["smart_balance", "fastest_wins", "high_impact", "deadline_driven"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks seeded before the run.")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests to send.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent client threads.")
+    parser.add_argument("--read-ratio", type=float, default=0.8,
+                        help="Fraction of requests that are GET /suggest/; the rest POST /analyze/.")
+    parser.add_argument("--workers", type=int, default=2, help="Gunicorn worker processes.")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for data and traffic.")
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout.")
+    return parser.parse_args()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def random_task(rng, title):
+    return {
+        "title": title,
+        "due_date": (date.today() + timedelta(days=rng.randint(-20, 60))).isoformat(),
+        "estimated_hours": rng.randint(1, 16),
+        "importance": rng.randint(1, 10),
+        "dependencies": [],
+    }
+
+
+def setup_database(db_path, count, rng):
+    # Runs in this process; the server processes inherit TASKS_DB_PATH
+    import django
+    os.environ["TASKS_DB_PATH"] = db_path
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+    django.setup()
+
+    from django.core.management import call_command
+    from tasks.models import Task
+    from tasks import explanations
+    from tasks.dependencies import index_tasks
+
+    call_command("migrate", verbosity=0)
+    codes = {
+        "smart_balance": explanations.EXPLAIN_SMART_BALANCE,
+        "fastest_wins": explanations.EXPLAIN_FASTEST_WINS,
+        "high_impact": explanations.EXPLAIN_HIGH_IMPACT,
+        "deadline_driven": explanations.EXPLAIN_DEADLINE_DRIVEN,
+    }
+    # Plausible stored scores are enough for /suggest/, which only reads them
+    tasks = []
+    for i in range(count):
+        item = random_task(rng, f"Seed task {i}")
+        days_to_due = (date.fromisoformat(item["due_date"]) - date.today()).days
+        task = Task(
+            title=item["title"],
+            due_date=date.fromisoformat(item["due_date"]),
+            estimated_hours=item["estimated_hours"],
+            importance=item["importance"],
+            dependencies=[str(rng.randint(1, count))] if rng.random() < 0.2 else [],
+            score=float(rng.randint(0, 250)),
+            strategy=rng.choice(STRATEGIES),
+        )
+        task.set_explanation((codes[task.strategy], days_to_due, 0))
+        tasks.append(task)
+    Task.objects.bulk_create(tasks, batch_size=1000)
+    # bulk_create skips post_save, so build the reverse dependency index directly
+    index_tasks(tasks)
+
+
+def start_server(port, db_path, workers, threads):
+    env = dict(os.environ, TASKS_DB_PATH=db_path)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "backend.wsgi",
+         "--bind", f"127.0.0.1:{port}",
+         "--workers", str(workers),
+         "--threads", str(threads),
+         "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("gunicorn exited during startup")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/tasks/stats/", timeout=1)
+            return server
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("gunicorn did not start within 30 seconds")
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile
+    if not sorted_values:
+        return None
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(values):
+    values = sorted(values)
+    if not values:
+        return None
+    return {
+        "mean_ms": round(sum(values) / len(values) * 1000, 2),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2),
+    }
+
+
+class Recorder:
+    # Failed requests are kept apart so they never skew the success percentiles
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.successes = {}
+        self.failures = {}
+        self.failure_reasons = {}
+
+    def record(self, endpoint, seconds, error=None):
+        with self.lock:
+            if error is None:
+                self.successes.setdefault(endpoint, []).append(seconds)
+                return
+            self.failures.setdefault(endpoint, []).append(seconds)
+            reasons = self.failure_reasons.setdefault(endpoint, {})
+            reasons[error] = reasons.get(error, 0) + 1
+
+    def totals(self):
+        succeeded = sum(len(values) for values in self.successes.values())
+        failed = sum(len(values) for values in self.failures.values())
+        return succeeded, failed
+
+    def summary(self, elapsed):
+        report = {}
+        for endpoint in sorted(set(self.successes) | set(self.failures)):
+            successes = self.successes.get(endpoint, [])
+            failures = self.failures.get(endpoint, [])
+            report[endpoint] = {
+                "requests": len(successes) + len(failures),
+                "succeeded": len(successes),
+                "errors": len(failures),
+                "throughput_rps": round(len(successes) / elapsed, 2),
+                "latency": latency_summary(successes),
+                "error_latency": latency_summary(failures),
+                "errors_by_reason": dict(sorted(self.failure_reasons.get(endpoint, {}).items())),
+            }
+        return report
+
+
+def error_reason(exc):
+    if isinstance(exc, urllib.error.HTTPError):
+        # The API reports failures as {"error": "..."}; fall back to the status alone
+        try:
+            message = json.loads(exc.read()).get("error")
+        except (ValueError, AttributeError, OSError):
+            message = None
+        return f"HTTP {exc.code}: {message}" if message else f"HTTP {exc.code}"
+    reason = getattr(exc, "reason", exc)
+    return f"{type(exc).__name__}: {reason}"
+
+
+def send(base_url, request_no, rng, read_ratio, recorder):
+    strategy = rng.choice(STRATEGIES)
+    if rng.random() < read_ratio:
+        endpoint = "suggest"
+        request = urllib.request.Request(f"{base_url}/suggest/?strategy={strategy}")
+    else:
+        endpoint = "analyze"
+        # Unique titles so the duplicate check never rejects a write
+        body = json.dumps([random_task(rng, f"Load task {request_no}")]).encode()
+        request = urllib.request.Request(
+            f"{base_url}/analyze/?strategy={strategy}",
+            data=body,
+            headers={"Content-Type": "application/json"},
+        )
+    start = time.perf_counter()
+    error = None
+    try:
+        # urlopen raises HTTPError for any non-2xx status
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+    except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+        error = error_reason(e)
+    recorder.record(endpoint, time.perf_counter() - start, error)
+
+
+def run_load(base_url, args):
+    recorder = Recorder()
+    counter = iter(range(args.requests))
+    counter_lock = threading.Lock()
+
+    def client(client_no):
+        rng = random.Random(f"{args.seed}-{client_no}")
+        while True:
+            with counter_lock:
+                request_no = next(counter, None)
+            if request_no is None:
+                return
+            send(base_url, request_no, rng, args.read_ratio, recorder)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(client, range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    return recorder, elapsed
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="task-load-")
+    db_path = os.path.join(workdir, "db.sqlite3")
+    server = None
+    try:
+        setup_database(db_path, args.tasks, random.Random(args.seed))
+        port = free_port()
+        server = start_server(port, db_path, args.workers, args.threads)
+        recorder, elapsed = run_load(f"http://127.0.0.1:{port}/api/tasks", args)
+        succeeded, failed = recorder.totals()
+        report = {
+            "config": {
+                "seeded_tasks": args.tasks,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "read_ratio": args.read_ratio,
+                "gunicorn_workers": args.workers,
+                "gunicorn_threads": args.threads,
+            },
+            "duration_s": round(elapsed, 3),
+            "succeeded": succeeded,
+            "errors": failed,
+            "throughput_rps": round(succeeded / elapsed, 2),
+            "endpoints": recorder.summary(elapsed),
+        }
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as out:
+            out.write(output + "\n")
+    else:
+        print(output)
@@ -21,13 +21,13 @@ if __name__ == "__main__":
     print("Running Task Analyzer Unit Tests...")
     print("="*60)
     
-    failures = runner.run_tests(["tasks.tests.ScoringAlgorithmTestCase"])
+    failures = runner.run_tests(["tasks.tests"])
     
     # Count total tests
-    from tasks.tests import ScoringAlgorithmTestCase
+    import tasks.tests
     import unittest
     
-    suite = unittest.TestLoader().loadTestsFromTestCase(ScoringAlgorithmTestCase)
+    suite = unittest.TestLoader().loadTestsFromModule(tasks.tests)
     total_tests = suite.countTestCases()
     passed_tests = total_tests - failures
     
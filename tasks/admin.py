@@ -1,4 +1,6 @@
 from django.contrib import admin
-from .models import Task
+from .models import Task, ArchivedTask, TaskDependency
 # Register your models here.
-admin.site.register(Task)
\ No newline at end of file
+admin.site.register(Task)
+admin.site.register(ArchivedTask)
+admin.site.register(TaskDependency)
\ No newline at end of file
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
+
+    def ready(self):
+        # Connect the signal handlers that keep the coalescing data version
+        # and the reverse dependency index current
+        from . import coalesce, dependencies  # noqa: F401
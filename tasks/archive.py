@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+from itertools import chain
+
+from django.db import transaction
+
+from .models import Task, ArchivedTask
+from .explanations import EXPLAIN_FIELDS
+from .specs import MAX_DAYS_OVERDUE
+
+ARCHIVE_FIELDS = (
+    'title', 'due_date', 'estimated_hours', 'importance',
+    'dependencies', 'score', 'strategy', *EXPLAIN_FIELDS,
+)
+DEFAULT_BATCH_SIZE = 500
+
+
+def archive_cutoff(retention_days=MAX_DAYS_OVERDUE, today=None):
+    # Tasks due strictly before the cutoff are cold
+    return (today or date.today()) - timedelta(days=retention_days)
+
+
+def archive_batch(cutoff, batch_size=DEFAULT_BATCH_SIZE):
+    """Move one batch of tasks due before ``cutoff`` into ArchivedTask.
+
+    Copy and delete happen in the same transaction, so an interrupted run
+    leaves every row in exactly one table and re-running simply picks up the
+    remaining tasks. Returns the number of rows moved.
+    """
+    with transaction.atomic():
+        rows = list(
+            Task.objects.filter(due_date__lt=cutoff)
+            .order_by('id')
+            .values_list('id', *ARCHIVE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+        ids = [row[0] for row in rows]
+        # An original_id collision (e.g. ids reused after a flush) raises
+        # IntegrityError and rolls back, rather than deleting an unarchived task
+        ArchivedTask.objects.bulk_create(
+            [ArchivedTask(original_id=row[0], **dict(zip(ARCHIVE_FIELDS, row[1:]))) for row in rows],
+        )
+        Task.objects.filter(id__in=ids).delete()
+    return len(ids)
+
+
+def archive_tasks(retention_days=MAX_DAYS_OVERDUE, batch_size=DEFAULT_BATCH_SIZE, today=None,
+                  on_batch=None):
+    # Each batch commits on its own, so an interrupted run resumes where it stopped.
+    # on_batch, if given, is called with the number of rows moved by each batch.
+    cutoff = archive_cutoff(retention_days, today)
+    total = 0
+    while True:
+        moved = archive_batch(cutoff, batch_size)
+        if not moved:
+            return total
+        total += moved
+        if on_batch:
+            on_batch(moved)
+
+
+def with_archived(queryset_filter, *fields, chunk_size=2000):
+    """Stream ``fields`` from live tasks, then from archived ones.
+
+    ``queryset_filter`` receives each queryset (Task, then ArchivedTask) and
+    returns it filtered, so one filter covers both tables. Archived rows report
+    their original Task id for ``'id'``.
+    """
+    live = queryset_filter(Task.objects.order_by('id')).values_list(*fields)
+    archived_fields = ['original_id' if field == 'id' else field for field in fields]
+    archived = queryset_filter(ArchivedTask.objects.order_by('original_id')).values_list(*archived_fields)
+    return chain(live.iterator(chunk_size=chunk_size), archived.iterator(chunk_size=chunk_size))
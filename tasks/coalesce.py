@@ -0,0 +1,142 @@
+import threading
+from functools import wraps
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpResponse
+
+from .models import Task
+
+# Seconds a follower waits for the in-flight computation before running its own
+DEFAULT_TIMEOUT = 10
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run at most one computation per key at a time within this process.
+
+    Callers that arrive while a computation for the same key is in flight wait
+    for its result (or exception) instead of recomputing it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'calls': 0, 'leaders': 0, 'coalesced': 0, 'timeouts': 0, 'errors': 0}
+
+    def do(self, key, fn, timeout=DEFAULT_TIMEOUT):
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['leaders'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except Exception as e:
+                call.error = e
+                with self._lock:
+                    self._stats['errors'] += 1
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+            return call.result
+
+        if not call.done.wait(timeout):
+            # Leader is stuck; don't hold this request hostage, compute directly
+            with self._lock:
+                self._stats['timeouts'] += 1
+            return fn()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats['in_flight'] = len(self._calls)
+        stats['hit_ratio'] = stats['coalesced'] / stats['calls'] if stats['calls'] else 0.0
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+flight = SingleFlight()
+
+
+# Process-local data version, part of every coalescing key so a request that
+# arrives after a write never joins a computation started before it.
+_data_version = 0
+_version_lock = threading.Lock()
+
+
+def data_version():
+    return _data_version
+
+
+def bump_data_version():
+    global _data_version
+    with _version_lock:
+        _data_version += 1
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def _task_changed(sender, **kwargs):
+    bump_data_version()
+
+
+def coalesce(view=None, timeout=DEFAULT_TIMEOUT):
+    """Coalesce concurrent identical GET/HEAD requests to ``view``.
+
+    The key is the view, method, query parameters and data version. Other
+    methods are passed straight through since they may write.
+    """
+    def decorator(view_func):
+        name = f"{view_func.__module__}.{view_func.__qualname__}"
+
+        def render(request, *args, **kwargs):
+            response = view_func(request, *args, **kwargs)
+            # Share plain data, never the response object itself: middleware
+            # mutates each caller's response independently
+            return response.status_code, response.content, list(response.items())
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+            key = (
+                name,
+                request.method,
+                tuple(sorted(kwargs.items())),
+                tuple(sorted((k, tuple(v)) for k, v in request.GET.lists())),
+                data_version(),
+            )
+            status, content, headers = flight.do(
+                key, lambda: render(request, *args, **kwargs), timeout=timeout
+            )
+            response = HttpResponse(content, status=status)
+            for header, value in headers:
+                response[header] = value
+            return response
+        return wrapper
+
+    if view is not None:
+        return decorator(view)
+    return decorator
@@ -0,0 +1,37 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Task, TaskDependency
+
+
+def dependency_ids(dependencies):
+    # Only numeric entries can reference task ids
+    return {int(dep) for dep in dependencies or [] if str(dep).isdigit()}
+
+
+def index_tasks(tasks):
+    # For newly created tasks, including ones saved with bulk_create
+    TaskDependency.objects.bulk_create(
+        [TaskDependency(task_id=task.id, depends_on=dep) for task in tasks for dep in dependency_ids(task.dependencies)],
+        ignore_conflicts=True,
+    )
+
+
+def sync_dependencies(task):
+    ids = dependency_ids(task.dependencies)
+    links = TaskDependency.objects.filter(task_id=task.id)
+    links.exclude(depends_on__in=ids).delete()
+    existing = set(links.values_list('depends_on', flat=True))
+    TaskDependency.objects.bulk_create(
+        [TaskDependency(task_id=task.id, depends_on=dep) for dep in ids - existing]
+    )
+
+
+@receiver(post_save, sender=Task)
+def _task_saved(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and 'dependencies' not in update_fields:
+        return
+    if created:
+        index_tasks([instance])
+    else:
+        sync_dependencies(instance)
@@ -0,0 +1,23 @@
+# Explanations are stored as compact components and only rendered to text when
+# a response asks for them.
+
+# Which scoring branch produced a score
+EXPLAIN_SMART_BALANCE = 0
+EXPLAIN_FASTEST_WINS = 1
+EXPLAIN_HIGH_IMPACT = 2
+EXPLAIN_DEADLINE_DRIVEN = 3
+
+# Model columns holding (explain_code, days_to_due, block_count)
+EXPLAIN_FIELDS = ('explain_code', 'explain_days_to_due', 'explain_blocks')
+
+
+def render_explanation(code, importance, effort, days_to_due, block_count):
+    if code == EXPLAIN_FASTEST_WINS:
+        return f"Strategy: Fastest Wins - Lower effort prioritized. Effort: {effort}h"
+    if code == EXPLAIN_HIGH_IMPACT:
+        return f"Strategy: High Impact - Importance prioritized. Importance: {importance}/10"
+    if code == EXPLAIN_DEADLINE_DRIVEN:
+        if days_to_due < 0:
+            return f"Strategy: Deadline Driven - Overdue by {abs(days_to_due)} business days [HIGH PRIORITY]"
+        return f"Strategy: Deadline Driven - Due in {days_to_due} business days"
+    return f"Strategy: Smart Balance - Importance: {importance}/10, Effort: {effort}h, Due in {days_to_due} business days, Blocks: {block_count} tasks"
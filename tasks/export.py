@@ -0,0 +1,87 @@
+import csv
+import json
+from datetime import datetime
+
+from .models import Task
+from .archive import with_archived
+from .explanations import EXPLAIN_FIELDS, render_explanation
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+EXPORT_FIELDS = (
+    'id', 'title', 'due_date', 'estimated_hours', 'importance',
+    'dependencies', 'score', 'explanation', 'strategy',
+)
+# Columns actually read; the explanation is rendered from its components
+QUERY_FIELDS = EXPORT_FIELDS[:7] + EXPORT_FIELDS[8:] + EXPLAIN_FIELDS
+# Rows fetched per database round trip while streaming
+EXPORT_CHUNK_SIZE = 2000
+
+
+def parse_date(value):
+    if value in (None, ''):
+        return None
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _filter(queryset, strategy, due_after, due_before):
+    if strategy:
+        queryset = queryset.filter(strategy=strategy)
+    if due_after:
+        queryset = queryset.filter(due_date__gte=due_after)
+    if due_before:
+        queryset = queryset.filter(due_date__lte=due_before)
+    return queryset
+
+
+def export_rows(strategy=None, due_after=None, due_before=None, include_archived=False):
+    # values_list + iterator keeps memory flat: plain tuples, no model instances,
+    # and no result cache on the queryset
+    def filter_tasks(queryset):
+        return _filter(queryset, strategy, due_after, due_before)
+
+    if include_archived:
+        rows = with_archived(filter_tasks, *QUERY_FIELDS, chunk_size=EXPORT_CHUNK_SIZE)
+    else:
+        tasks = filter_tasks(Task.objects.order_by('id'))
+        rows = tasks.values_list(*QUERY_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return map(_export_row, rows)
+
+
+def _export_row(row):
+    # QUERY_FIELDS order in, EXPORT_FIELDS order out
+    code, days_to_due, block_count = row[8:]
+    explanation = None
+    if code is not None:
+        explanation = render_explanation(code, row[4], row[3], days_to_due, block_count)
+    return row[:7] + (explanation, row[7])
+
+
+class _Echo:
+    # csv.writer needs a file-like object; hand each formatted line straight back
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        row = list(row)
+        row[2] = row[2].isoformat()
+        row[5] = json.dumps(row[5])
+        yield writer.writerow(row)
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        record = dict(zip(EXPORT_FIELDS, row))
+        record['due_date'] = record['due_date'].isoformat()
+        yield json.dumps(record) + "\n"
+
+
+def iter_export(export_format, rows):
+    if export_format == 'csv':
+        return iter_csv(rows)
+    if export_format == 'ndjson':
+        return iter_ndjson(rows)
+    raise ValueError(f"Unsupported export format: {export_format}")
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from tasks.archive import DEFAULT_BATCH_SIZE, archive_cutoff, archive_tasks
+from tasks.models import Task
+from tasks.specs import MAX_DAYS_OVERDUE
+
+
+class Command(BaseCommand):
+    help = "Move tasks that are overdue beyond the retention window into the ArchivedTask table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=MAX_DAYS_OVERDUE,
+                            help="Archive tasks due more than this many days ago.")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="Rows moved per transaction.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only report how many tasks would be archived.")
+
+    def handle(self, *args, **options):
+        if options['days'] < 0:
+            raise CommandError("--days must not be negative.")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        cutoff = archive_cutoff(options['days'])
+        if options['dry_run']:
+            count = Task.objects.filter(due_date__lt=cutoff).count()
+            self.stdout.write(f"{count} task(s) due before {cutoff} would be archived.")
+            return
+
+        def report_batch(moved):
+            if options['verbosity'] > 1:
+                self.stdout.write(f"Archived batch of {moved} task(s).")
+
+        try:
+            total = archive_tasks(options['days'], options['batch_size'], on_batch=report_batch)
+        except IntegrityError as e:
+            raise CommandError(f"Archive row already exists for a live task id; nothing in that batch was moved. ({e})")
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} task(s) due before {cutoff}."))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.export import EXPORT_FORMATS, export_rows, iter_export, parse_date
+
+
+class Command(BaseCommand):
+    help = "Stream every task with its score, explanation and strategy as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+        parser.add_argument('--strategy', help="Only export tasks scored with this strategy.")
+        parser.add_argument('--due-after', help="Only export tasks due on or after this date (YYYY-MM-DD).")
+        parser.add_argument('--due-before', help="Only export tasks due on or before this date (YYYY-MM-DD).")
+        parser.add_argument('--include-archived', action='store_true',
+                            help="Also export tasks moved to the archive.")
+        parser.add_argument('--output', '-o', help="File to write to. Defaults to stdout.")
+
+    def handle(self, *args, **options):
+        try:
+            due_after = parse_date(options['due_after'])
+            due_before = parse_date(options['due_before'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        rows = export_rows(
+            strategy=options['strategy'],
+            due_after=due_after,
+            due_before=due_before,
+            include_archived=options['include_archived'],
+        )
+        chunks = iter_export(options['format'], rows)
+        if options['output']:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as out:
+                out.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_explanation_task_score_task_strategy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('title', models.CharField(max_length=200)),
+                ('due_date', models.DateField()),
+                ('estimated_hours', models.IntegerField(default=1)),
+                ('importance', models.IntegerField(default=5)),
+                ('dependencies', models.JSONField(blank=True, default=list)),
+                ('score', models.FloatField(blank=True, null=True)),
+                ('explanation', models.TextField(blank=True, null=True)),
+                ('strategy', models.CharField(default='smart_balance', max_length=50)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='due_date',
+            field=models.DateField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:36
+
+import re
+
+from django.db import migrations, models
+
+STRATEGY_CODES = (
+    ('Smart Balance', 0),
+    ('Fastest Wins', 1),
+    ('High Impact', 2),
+    ('Deadline Driven', 3),
+)
+
+
+def _components(explanation):
+    code = next((code for name, code in STRATEGY_CODES if f"Strategy: {name}" in explanation), None)
+    if code is None:
+        return None, None, None
+    days = re.search(r"Due in (-?\d+) business days", explanation)
+    overdue = re.search(r"Overdue by (\d+) business days", explanation)
+    blocks = re.search(r"Blocks: (\d+) tasks", explanation)
+    if days:
+        days_to_due = int(days.group(1))
+    elif overdue:
+        days_to_due = -int(overdue.group(1))
+    else:
+        days_to_due = None
+    return code, days_to_due, int(blocks.group(1)) if blocks else 0
+
+
+def parse_explanations(apps, schema_editor):
+    # Carry stored explanation text over into the structured columns
+    for model_name in ('Task', 'ArchivedTask'):
+        model = apps.get_model('tasks', model_name)
+        rows = model.objects.exclude(explanation__isnull=True).values_list('id', 'explanation')
+        for row_id, explanation in rows.iterator():
+            code, days_to_due, blocks = _components(explanation)
+            model.objects.filter(id=row_id).update(
+                explain_code=code, explain_days_to_due=days_to_due, explain_blocks=blocks,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_archivedtask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedtask',
+            name='explain_blocks',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='archivedtask',
+            name='explain_code',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='archivedtask',
+            name='explain_days_to_due',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='explain_blocks',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='explain_code',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='explain_days_to_due',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(parse_explanations, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='archivedtask',
+            name='explanation',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='explanation',
+        ),
+    ]
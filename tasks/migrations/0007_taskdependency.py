@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_index(apps, schema_editor):
+    # Store every dependency as a string, as /analyze/ and PATCH now do, and
+    # index the numeric ones
+    Task = apps.get_model('tasks', 'Task')
+    TaskDependency = apps.get_model('tasks', 'TaskDependency')
+    links = []
+    for task in Task.objects.exclude(dependencies=[]).only('id', 'dependencies').iterator():
+        dependencies = [str(dep) for dep in task.dependencies or []]
+        if dependencies != task.dependencies:
+            Task.objects.filter(id=task.id).update(dependencies=dependencies)
+        links.extend(
+            TaskDependency(task_id=task.id, depends_on=int(dep))
+            for dep in set(dependencies) if dep.isdigit()
+        )
+    TaskDependency.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_structured_explanation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDependency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depends_on', models.BigIntegerField(db_index=True)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dependency_links', to='tasks.task')),
+            ],
+            options={
+                'unique_together': {('task', 'depends_on')},
+            },
+        ),
+        migrations.RunPython(build_index, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,68 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .explanations import render_explanation
 # Create your models here.
-class Task(models.Model):
+
+class ExplainedTask(models.Model):
+    # Structured scoring explanation; see tasks.explanations
+    explain_code=models.PositiveSmallIntegerField(null=True, blank=True)
+    explain_days_to_due=models.IntegerField(null=True, blank=True)
+    explain_blocks=models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+
+    def set_explanation(self, components):
+        self.explain_code, self.explain_days_to_due, self.explain_blocks = components
+
+    @property
+    def explanation(self):
+        if self.explain_code is None:
+            return None
+        return render_explanation(self.explain_code, self.importance, self.estimated_hours,
+                                  self.explain_days_to_due, self.explain_blocks)
+
+
+class Task(ExplainedTask):
     title=models.CharField(max_length=200)
-    due_date=models.DateField()
+    due_date=models.DateField(db_index=True)
     estimated_hours=models.IntegerField(default=1)
     # Importance on a scale from 1 (least important) to 10 (most important)
     importance=models.IntegerField(default=5, validators=[MinValueValidator(1), MaxValueValidator(10)])
     dependencies=models.JSONField(default=list, blank=True)
     
     score=models.FloatField(null=True, blank=True)
-    explanation=models.TextField(null=True, blank=True)
     strategy=models.CharField(max_length=50, default='smart_balance')
     def __str__(self):
         return self.title
+
+
+# Reverse dependency index: one row per (task, task id it depends on), so the
+# tasks blocked by an id are an indexed lookup instead of a scan over every
+# dependencies list. Kept in sync with Task.dependencies by tasks.dependencies.
+class TaskDependency(models.Model):
+    task=models.ForeignKey(Task, on_delete=models.CASCADE, related_name='dependency_links')
+    depends_on=models.BigIntegerField(db_index=True)
+
+    class Meta:
+        unique_together = [('task', 'depends_on')]
+    def __str__(self):
+        return f"{self.task_id} -> {self.depends_on}"
+
+
+# Cold storage for tasks moved out of Task by the archive_tasks command.
+# original_id is unique so re-running an interrupted archive never duplicates rows.
+class ArchivedTask(ExplainedTask):
+    original_id=models.BigIntegerField(unique=True)
+    title=models.CharField(max_length=200)
+    due_date=models.DateField()
+    estimated_hours=models.IntegerField(default=1)
+    importance=models.IntegerField(default=5)
+    dependencies=models.JSONField(default=list, blank=True)
+
+    score=models.FloatField(null=True, blank=True)
+    strategy=models.CharField(max_length=50, default='smart_balance')
+    archived_at=models.DateTimeField(auto_now_add=True)
+    def __str__(self):
+        return self.title
+
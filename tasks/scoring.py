@@ -1,17 +1,19 @@
 from .models import Task
+from .specs import MAX_DAYS_OVERDUE, TaskSpec, validate_task
+from .explanations import (
+    EXPLAIN_DEADLINE_DRIVEN, EXPLAIN_FASTEST_WINS, EXPLAIN_FIELDS, EXPLAIN_HIGH_IMPACT,
+    EXPLAIN_SMART_BALANCE, render_explanation,
+)
 from datetime import date
 import numpy as np
 import holidays
-def score_task(task: Task, strategy="smart_balance", task_list=None):
+
+def score_components(task: Task | TaskSpec, strategy="smart_balance", task_list=None):
+    # Hot path: returns (score, (explain_code, days_to_due, block_count)) and
+    # leaves formatting the explanation to render_explanation
+    validate_task(task.due_date, task.importance, task.estimated_hours)
     count_days_past_due=(task.due_date-date.today()).days
-    if  count_days_past_due < -30:
-        raise ValueError("Due date is too far in the past.")
     # Calculate business days (excluding weekends and holidays)
-    if task.importance < 1 or task.importance > 10:
-        raise ValueError("Importance must be between 1 and 10.")
-    if task.estimated_hours < 1:
-        raise ValueError("Estimated hours must be at least 1.")
-    
     year1 = date.today().year
     year2=task.due_date.year
     holidays_list= holidays.CountryHoliday('IN', years=range(year1, year2+1))
@@ -29,37 +31,54 @@ def score_task(task: Task, strategy="smart_balance", task_list=None):
         )
     importance = task.importance
     effort = task.estimated_hours
+    days_to_due = int(days_to_due)
+    block_count = 0
 
     if strategy == "fastest_wins":
         # Lowest effort gets highest score
         score = 100 - effort * 10 + (importance)  # effort dominates
-        explanation = f"Strategy: Fastest Wins - Lower effort prioritized. Effort: {effort}h"
+        code = EXPLAIN_FASTEST_WINS
     elif strategy == "high_impact":
         # Importance dominates
         score = importance * 10 - effort 
-        explanation = f"Strategy: High Impact - Importance prioritized. Importance: {importance}/10"
+        code = EXPLAIN_HIGH_IMPACT
     elif strategy == "deadline_driven":
         # Urgency/due dominates, overdue tasks get bonus
         if days_to_due < 0:
             score = 200 + abs(days_to_due) * 5  # Overdue boosted
-            explanation = f"Strategy: Deadline Driven - Overdue by {abs(days_to_due)} business days [HIGH PRIORITY]"
         else:
             score = 100 - days_to_due + importance
-            explanation = f"Strategy: Deadline Driven - Due in {days_to_due} business days"
+        code = EXPLAIN_DEADLINE_DRIVEN
     else:
         # smart_balance (default): combines all
-        block_score = 0
-        if task_list:
+        # Unsaved tasks have no id yet, so nothing can depend on them
+        if task.id and task_list:
             # Score higher if other tasks depend on this
-            task_id = str(task.id if task.id else "")
+            task_id = str(task.id)
             for t in task_list:
-                if isinstance(t, dict):
-                    deps = t.get('dependencies', [])
-                else:
-                    deps = t.dependencies if isinstance(t.dependencies, list) else []
-                if task_id and task_id in deps:
-                    block_score += 20
+                deps = t.dependencies
+                if isinstance(deps, list) and task_id in deps:
+                    block_count += 1
         # Blend: overdue, soon due, important, low effort, blocks others
-        score = importance*3 - effort + (0 if days_to_due < 0 else max(0, 10-days_to_due)) + block_score
-        explanation = f"Strategy: Smart Balance - Importance: {importance}/10, Effort: {effort}h, Due in {days_to_due} business days, Blocks: {block_score//20} tasks"
-    return score, explanation
\ No newline at end of file
+        score = importance*3 - effort + (0 if days_to_due < 0 else max(0, 10-days_to_due)) + block_count * 20
+        code = EXPLAIN_SMART_BALANCE
+    return score, (code, days_to_due, block_count)
+
+
+def score_task(task: Task | TaskSpec, strategy="smart_balance", task_list=None):
+    score, (code, days_to_due, block_count) = score_components(task, strategy, task_list)
+    return score, render_explanation(code, task.importance, task.estimated_hours, days_to_due, block_count)
+
+
+def dependents_of(task_id):
+    # Indexed lookup through TaskDependency rather than a scan of Task.dependencies
+    return Task.objects.filter(dependency_links__depends_on=task_id).only('id', 'dependencies')
+
+
+def rescore_task(task):
+    # The queryset stays lazy, so only smart_balance pays for the dependency lookup
+    score, components = score_components(task, strategy=task.strategy, task_list=dependents_of(task.id))
+    task.score = score
+    task.set_explanation(components)
+    task.save(update_fields=['score', *EXPLAIN_FIELDS])
+    return task
@@ -0,0 +1,52 @@
+from datetime import date, datetime
+from typing import NamedTuple, Optional
+
+
+# Tasks overdue by more than this many days can no longer be scored
+MAX_DAYS_OVERDUE = 30
+
+
+class TaskSpec(NamedTuple):
+    # Plain record handed to the scorer; ORM instances are only built to persist
+    title: str
+    due_date: date
+    estimated_hours: int
+    importance: int
+    dependencies: list
+    id: Optional[int] = None
+
+
+def validate_task(due_date, importance, estimated_hours):
+    if (due_date - date.today()).days < -MAX_DAYS_OVERDUE:
+        raise ValueError("Due date is too far in the past.")
+    if importance < 1 or importance > 10:
+        raise ValueError("Importance must be between 1 and 10.")
+    if estimated_hours < 1:
+        raise ValueError("Estimated hours must be at least 1.")
+
+
+def parse_task_spec(item):
+    if not isinstance(item, dict):
+        raise ValueError('Each task must be an object.')
+    if 'title' not in item or item['title'] == '':
+        raise ValueError('Title is required field.')
+    dependencies = item.get("dependencies", [])
+    if not isinstance(dependencies, list):
+        raise ValueError('Dependencies must be a list.')
+    spec = TaskSpec(
+        title=item["title"],
+        due_date=datetime.strptime(item["due_date"], "%Y-%m-%d").date(),
+        estimated_hours=int(item["estimated_hours"]),
+        importance=int(item["importance"]),
+        # Stored as strings, the same format PATCH writes
+        dependencies=[str(dep) for dep in dependencies],
+    )
+    validate_task(spec.due_date, spec.importance, spec.estimated_hours)
+    return spec
+
+
+def parse_task_specs(items):
+    # One validation pass over the request before anything is scored or saved
+    if not isinstance(items, list):
+        raise ValueError('Request body must be a list of tasks.')
+    return [parse_task_spec(item) for item in items]
@@ -1,7 +1,20 @@
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase, TransactionTestCase, Client, RequestFactory
+from django.db import connection
+from django.http import JsonResponse
+from django.db import IntegrityError
+from django.core.management import call_command
 from datetime import date, timedelta
-from .models import Task
-from .scoring import score_task
+import csv
+import io
+import json
+import threading
+import time
+from .models import Task, ArchivedTask, TaskDependency
+from .scoring import score_task, score_components, rescore_task, dependents_of
+from .explanations import EXPLAIN_HIGH_IMPACT, EXPLAIN_SMART_BALANCE
+from .specs import TaskSpec, parse_task_specs
+from .archive import archive_batch, archive_cutoff, archive_tasks, with_archived
+from .coalesce import SingleFlight, coalesce, data_version, flight
 
 
 class ScoringAlgorithmTestCase(TestCase):
@@ -225,4 +238,530 @@ class ScoringAlgorithmTestCase(TestCase):
             dependencies=[]
         )
         with self.assertRaises(ValueError):
-            score_task(very_old_task)
\ No newline at end of file
+            score_task(very_old_task)
+
+class ExportTestCase(TestCase):
+    """Test suite for the streaming task export"""
+
+    def setUp(self):
+        self.task_a = Task.objects.create(
+            title="Write report, draft",
+            due_date=date.today() + timedelta(days=3),
+            estimated_hours=2,
+            importance=6,
+            dependencies=[],
+            score=18.0,
+            explain_code=EXPLAIN_SMART_BALANCE,
+            explain_days_to_due=3,
+            explain_blocks=1,
+            strategy="smart_balance",
+        )
+        self.task_b = Task.objects.create(
+            title="Ship release",
+            due_date=date.today() + timedelta(days=20),
+            estimated_hours=1,
+            importance=9,
+            dependencies=[str(self.task_a.id)],
+            score=89.0,
+            explain_code=EXPLAIN_HIGH_IMPACT,
+            explain_days_to_due=14,
+            explain_blocks=0,
+            strategy="high_impact",
+        )
+
+    def test_csv_export_streams_all_tasks(self):
+        """CSV export streams a header plus one row per task"""
+        response = self.client.get('/api/tasks/export/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(rows[0][:3], ['id', 'title', 'due_date'])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][1], "Write report, draft")
+
+    def test_ndjson_export_with_filters(self):
+        """NDJSON export honours the strategy and due date filters"""
+        response = self.client.get('/api/tasks/export/', {'format': 'ndjson', 'strategy': 'high_impact'})
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual(record['title'], "Ship release")
+        self.assertEqual(record['dependencies'], [str(self.task_a.id)])
+        self.assertEqual(record['explanation'], "Strategy: High Impact - Importance prioritized. Importance: 9/10")
+
+        response = self.client.get('/api/tasks/export/', {
+            'format': 'ndjson',
+            'due_before': (date.today() + timedelta(days=5)).isoformat(),
+        })
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [self.task_a.id])
+
+    def test_export_rejects_bad_parameters(self):
+        """Unknown formats and malformed dates return 400"""
+        self.assertEqual(self.client.get('/api/tasks/export/', {'format': 'xml'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/tasks/export/', {'due_after': '31-12-2025'}).status_code, 400)
+
+    def test_export_management_command(self):
+        """export_tasks command writes the same stream to stdout"""
+        out = io.StringIO()
+        call_command('export_tasks', format='ndjson', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])['strategy'], "high_impact")
+
+
+class ArchiveTestCase(TestCase):
+    """Test suite for moving old tasks into the archive"""
+
+    def setUp(self):
+        self.old_tasks = [
+            Task.objects.create(
+                title=f"Old task {i}",
+                due_date=date.today() - timedelta(days=40 + i),
+                estimated_hours=2,
+                importance=5,
+                dependencies=[],
+                score=10.0,
+                strategy="smart_balance",
+            )
+            for i in range(5)
+        ]
+        self.recent_task = Task.objects.create(
+            title="Recent task",
+            due_date=date.today() - timedelta(days=5),
+            estimated_hours=2,
+            importance=5,
+            dependencies=[],
+        )
+
+    def test_archive_moves_only_old_tasks(self):
+        """Tasks beyond the retention window move to ArchivedTask in batches"""
+        moved = archive_tasks(retention_days=30, batch_size=2)
+        self.assertEqual(moved, 5)
+        self.assertEqual(list(Task.objects.values_list('id', flat=True)), [self.recent_task.id])
+        self.assertEqual(
+            sorted(ArchivedTask.objects.values_list('original_id', flat=True)),
+            [t.id for t in self.old_tasks],
+        )
+
+    def test_archive_is_resumable(self):
+        """A re-run after a partial archive moves only the remaining tasks"""
+        batches = []
+        self.assertEqual(archive_batch(archive_cutoff(30), batch_size=2), 2)
+        self.assertEqual(archive_tasks(retention_days=30, batch_size=2, on_batch=batches.append), 3)
+        self.assertEqual(batches, [2, 1])
+        self.assertEqual(archive_tasks(retention_days=30), 0)
+        self.assertEqual(ArchivedTask.objects.count(), 5)
+
+    def test_archive_collision_keeps_live_task(self):
+        """An archive row with a colliding original_id never costs a live task"""
+        ArchivedTask.objects.create(
+            original_id=self.old_tasks[0].id,
+            title="Unrelated task archived before a flush",
+            due_date=date.today() - timedelta(days=100),
+        )
+        with self.assertRaises(IntegrityError):
+            archive_batch(archive_cutoff(30), batch_size=10)
+        self.assertEqual(Task.objects.count(), 6)
+        self.assertEqual(ArchivedTask.objects.count(), 1)
+
+    def test_with_archived_queries_both_tables(self):
+        """with_archived applies one filter to live and archived tasks"""
+        archive_tasks(retention_days=30)
+        rows = list(with_archived(lambda qs: qs.filter(due_date__lt=date.today() - timedelta(days=40)), 'id', 'title'))
+        self.assertEqual(rows, [(t.id, t.title) for t in self.old_tasks[1:]])
+        titles = [title for _, title in with_archived(lambda qs: qs, 'id', 'title')]
+        self.assertEqual(titles[0], "Recent task")
+        self.assertEqual(len(titles), 6)
+
+    def test_export_can_include_archive(self):
+        """Archived tasks are only exported when explicitly requested"""
+        call_command('archive_tasks', stdout=io.StringIO())
+        response = self.client.get('/api/tasks/export/', {'format': 'ndjson'})
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 1)
+        response = self.client.get('/api/tasks/export/', {'format': 'ndjson', 'include_archived': '1'})
+        ids = [json.loads(line)['id'] for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(ids, [self.recent_task.id] + [t.id for t in self.old_tasks])
+
+
+class CoalesceTestCase(SimpleTestCase):
+    """Test suite for single-flight request coalescing"""
+
+    def wait_for_calls(self, group, count, timeout=5):
+        # Fail rather than hang if callers never reach the single-flight group
+        deadline = time.monotonic() + timeout
+        while group.stats()['calls'] < count:
+            if time.monotonic() > deadline:
+                self.fail(f"Only {group.stats()['calls']} of {count} callers arrived within {timeout}s")
+            time.sleep(0.01)
+
+    def run_concurrently(self, target, count):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def test_concurrent_callers_share_one_computation(self):
+        """Callers arriving while a computation is in flight reuse its result"""
+        group = SingleFlight()
+        release = threading.Event()
+        computed = []
+        results = []
+
+        def compute():
+            computed.append(1)
+            release.wait(5)
+            return 42
+
+        threads = self.run_concurrently(lambda: results.append(group.do('key', compute)), 5)
+        self.wait_for_calls(group, 5)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(computed), 1)
+        self.assertEqual(results, [42] * 5)
+        stats = group.stats()
+        self.assertEqual(stats['coalesced'], 4)
+        self.assertAlmostEqual(stats['hit_ratio'], 0.8)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_errors_propagate_to_waiting_callers(self):
+        """An exception in the leader is raised in every waiting caller"""
+        group = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def compute():
+            release.wait(5)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                group.do('key', compute)
+            except ValueError as e:
+                errors.append(str(e))
+
+        threads = self.run_concurrently(call, 3)
+        self.wait_for_calls(group, 3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, ["boom"] * 3)
+        self.assertEqual(group.stats()['errors'], 1)
+
+    def test_follower_computes_itself_after_timeout(self):
+        """A follower stops waiting on a stuck leader after the timeout"""
+        group = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=lambda: group.do('key', lambda: release.wait(5)))
+        leader.start()
+        self.wait_for_calls(group, 1)
+
+        self.assertEqual(group.do('key', lambda: "direct", timeout=0.05), "direct")
+        self.assertEqual(group.stats()['timeouts'], 1)
+        release.set()
+        leader.join()
+
+    def test_concurrent_requests_run_decorated_view_once(self):
+        """Concurrent identical requests through the decorator share one view execution"""
+        release = threading.Event()
+        executions = []
+
+        def view(request):
+            executions.append(1)
+            release.wait(5)
+            return JsonResponse({'executions': len(executions)})
+
+        coalesced_view = coalesce(view)
+        request = RequestFactory().get('/suggest/', {'case': 'concurrent-view'})
+        responses = []
+        flight.reset_stats()
+        threads = self.run_concurrently(lambda: responses.append(coalesced_view(request)), 6)
+        self.wait_for_calls(flight, 6)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(len(responses), 6)
+        self.assertEqual(len({id(response) for response in responses}), 6)
+        for response in responses:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(json.loads(response.content), {'executions': 1})
+
+    def test_decorated_view_returns_fresh_response(self):
+        """Each caller of a coalesced view gets its own response object"""
+        view = coalesce(lambda request: JsonResponse({'ok': True}))
+        request = RequestFactory().get('/suggest/', {'strategy': 'fastest_wins'})
+        first, second = view(request), view(request)
+        self.assertIsNot(first, second)
+        self.assertEqual(json.loads(second.content), {'ok': True})
+        self.assertEqual(second['Content-Type'], 'application/json')
+
+
+class DataVersionTestCase(TestCase):
+    """Task writes invalidate the coalescing key"""
+
+    def test_task_save_bumps_data_version(self):
+        before = data_version()
+        Task.objects.create(title="New", due_date=date.today(), estimated_hours=1, importance=5)
+        self.assertGreater(data_version(), before)
+
+    def test_stats_endpoint_reports_hit_ratio(self):
+        flight.reset_stats()
+        self.client.get('/api/tasks/suggest/')
+        stats = self.client.get('/api/tasks/stats/').json()['coalescing']
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['hit_ratio'], 0.0)
+
+
+class PatchTaskTestCase(TestCase):
+    """Test suite for in-place task edits and incremental rescoring"""
+
+    def setUp(self):
+        self.blocker = Task.objects.create(
+            title="Design API schema",
+            due_date=date.today() + timedelta(days=20),
+            estimated_hours=4,
+            importance=8,
+            dependencies=[],
+            strategy="smart_balance",
+        )
+        self.other = Task.objects.create(
+            title="Write docs",
+            due_date=date.today() + timedelta(days=20),
+            estimated_hours=2,
+            importance=5,
+            dependencies=[],
+            strategy="smart_balance",
+        )
+        self.dependent = Task.objects.create(
+            title="Implement API endpoints",
+            due_date=date.today() + timedelta(days=20),
+            estimated_hours=8,
+            importance=7,
+            dependencies=[str(self.blocker.id)],
+            strategy="smart_balance",
+        )
+        for task in (self.blocker, self.other, self.dependent):
+            rescore_task(task)
+
+    def patch(self, url, data):
+        return self.client.patch(url, json.dumps(data), content_type='application/json')
+
+    def test_patch_updates_fields_and_score(self):
+        """PATCH edits the task in place and recomputes its score"""
+        response = self.patch(f'/api/tasks/{self.other.id}/', {'importance': 9})
+        self.assertEqual(response.status_code, 200)
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.importance, 9)
+        self.assertEqual(response.json()['task']['score'], self.other.score)
+        self.assertEqual(response.json()['rescored'], [])
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_patch_dependencies_rescores_neighbors(self):
+        """Moving a dependency rescores only the old and new blockers"""
+        blocker_score = self.blocker.score
+        self.assertIn("Blocks: 1 tasks", self.blocker.explanation)
+
+        response = self.patch(f'/api/tasks/{self.dependent.id}/', {'dependencies': [str(self.other.id)]})
+        self.assertEqual(response.json()['rescored'], sorted([self.blocker.id, self.other.id]))
+        self.blocker.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual(self.blocker.score, blocker_score - 20)
+        self.assertIn("Blocks: 1 tasks", self.other.explanation)
+
+    def test_bulk_patch(self):
+        """Bulk PATCH applies every edit atomically"""
+        response = self.patch('/api/tasks/bulk/', [
+            {'id': self.blocker.id, 'estimated_hours': 1},
+            {'id': self.other.id, 'dependencies': [str(self.blocker.id)]},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.blocker.refresh_from_db()
+        self.assertEqual(self.blocker.estimated_hours, 1)
+        self.assertIn("Blocks: 2 tasks", self.blocker.explanation)
+
+        response = self.patch('/api/tasks/bulk/', [
+            {'id': self.blocker.id, 'importance': 3},
+            {'id': self.other.id, 'importance': 42},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.blocker.refresh_from_db()
+        self.assertEqual(self.blocker.importance, 8)
+
+    def test_patch_errors(self):
+        """Unknown tasks, unknown fields and bad methods are rejected"""
+        self.assertEqual(self.patch('/api/tasks/999999/', {'importance': 5}).status_code, 404)
+        self.assertEqual(self.patch(f'/api/tasks/{self.other.id}/', {'colour': 'red'}).status_code, 400)
+        self.assertEqual(self.client.get(f'/api/tasks/{self.other.id}/').status_code, 405)
+
+    def test_title_only_patch_keeps_stored_score(self):
+        """Edits that don't touch a scoring input skip rescoring, even when long overdue"""
+        old_task = Task.objects.create(
+            title="Old", due_date=date.today() - timedelta(days=45), estimated_hours=1, importance=5, score=12.0,
+        )
+        response = self.patch(f'/api/tasks/{old_task.id}/', {'title': "Renamed"})
+        self.assertEqual(response.status_code, 200)
+        old_task.refresh_from_db()
+        self.assertEqual((old_task.title, old_task.score), ("Renamed", 12.0))
+        self.assertEqual(self.patch(f'/api/tasks/{old_task.id}/', {'importance': 6}).status_code, 400)
+
+    def test_patch_rejects_mismatched_body_id(self):
+        url = f'/api/tasks/{self.other.id}/'
+        self.assertEqual(self.patch(url, {'id': self.blocker.id, 'importance': 9}).status_code, 400)
+        self.assertEqual(self.patch(url, {'id': self.other.id, 'importance': 9}).status_code, 200)
+
+    def test_dependency_index_follows_edits(self):
+        """TaskDependency mirrors dependencies and backs dependents_of"""
+        self.assertEqual(list(dependents_of(self.blocker.id)), [self.dependent])
+        self.patch(f'/api/tasks/{self.dependent.id}/', {'dependencies': [self.other.id, "design doc"]})
+        self.assertEqual(list(dependents_of(self.blocker.id)), [])
+        self.assertEqual(list(dependents_of(self.other.id)), [self.dependent])
+        self.assertEqual(
+            list(TaskDependency.objects.values_list('task_id', 'depends_on')),
+            [(self.dependent.id, self.other.id)],
+        )
+
+    def test_analyze_stores_dependencies_as_strings(self):
+        """POSTed integer dependencies are stored and indexed like PATCHed ones"""
+        payload = [{"title": "Follow-up", "due_date": "2030-01-15", "estimated_hours": 1,
+                    "importance": 5, "dependencies": [self.other.id]}]
+        response = self.client.post('/api/tasks/analyze/', json.dumps(payload), content_type='application/json')
+        self.assertEqual(response.json()['tasks'][0]['dependencies'], [str(self.other.id)])
+        self.assertEqual([t.title for t in dependents_of(self.other.id)], ["Follow-up"])
+
+    def test_bulk_patch_accepts_string_ids(self):
+        """Bulk PATCH takes ids as numeric strings, like the single-task route"""
+        response = self.patch('/api/tasks/bulk/', [{'id': str(self.other.id), 'importance': 9}])
+        self.assertEqual(response.status_code, 200)
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.importance, 9)
+        self.assertEqual(self.patch('/api/tasks/bulk/', [{'id': 'abc', 'importance': 9}]).status_code, 400)
+        self.assertEqual(self.patch('/api/tasks/bulk/', [{'id': None, 'importance': 9}]).status_code, 400)
+
+
+class ExplanationTestCase(TestCase):
+    """Explanations are stored as components and rendered on request"""
+
+    def setUp(self):
+        self.payload = json.dumps([{
+            "title": "Plan sprint",
+            "due_date": (date.today() + timedelta(days=7)).isoformat(),
+            "estimated_hours": 3,
+            "importance": 6,
+            "dependencies": [],
+        }])
+
+    def test_components_render_to_score_task_text(self):
+        """Stored components render to the same text score_task returns"""
+        task = Task(title="t", due_date=date.today() + timedelta(days=5), estimated_hours=2, importance=7)
+        for strategy in ("smart_balance", "fastest_wins", "high_impact", "deadline_driven"):
+            score, components = score_components(task, strategy=strategy)
+            task.set_explanation(components)
+            self.assertEqual((score, task.explanation), score_task(task, strategy=strategy))
+
+    def test_analyze_renders_explanation_only_when_asked(self):
+        response = self.client.post('/api/tasks/analyze/?strategy=high_impact', self.payload, content_type='application/json')
+        self.assertNotIn('explanation', response.json()['tasks'][0])
+        task = Task.objects.get()
+        self.assertEqual(task.explain_code, EXPLAIN_HIGH_IMPACT)
+
+        response = self.client.get('/api/tasks/suggest/', {'explain': '1'})
+        self.assertEqual(
+            response.json()['suggestions'][0]['explanation'],
+            "Strategy: High Impact - Importance prioritized. Importance: 6/10",
+        )
+        self.assertNotIn('explanation', self.client.get('/api/tasks/suggest/').json()['suggestions'][0])
+
+
+class TaskSpecTestCase(TestCase):
+    """Test suite for scoring plain TaskSpec records"""
+
+    def test_parse_task_specs(self):
+        specs = parse_task_specs([{
+            "title": "Plan sprint",
+            "due_date": "2030-01-15",
+            "estimated_hours": "3",
+            "importance": 6,
+        }])
+        self.assertEqual(specs, [TaskSpec("Plan sprint", date(2030, 1, 15), 3, 6, [])])
+        with self.assertRaises(ValueError):
+            parse_task_specs([{"title": "", "due_date": "2030-01-15", "estimated_hours": 1, "importance": 1}])
+        with self.assertRaises(ValueError):
+            parse_task_specs({"title": "Not a list"})
+
+    def test_score_task_accepts_spec(self):
+        """A TaskSpec scores exactly like the equivalent model instance"""
+        blocker = Task.objects.create(
+            title="Blocker",
+            due_date=date.today() + timedelta(days=4),
+            estimated_hours=2,
+            importance=7,
+        )
+        spec = TaskSpec("Blocker", blocker.due_date, 2, 7, [], id=blocker.id)
+        dependents = [TaskSpec("Dependent", blocker.due_date, 1, 5, [str(blocker.id)])]
+        self.assertEqual(
+            score_task(spec, task_list=dependents),
+            score_task(blocker, task_list=dependents),
+        )
+        self.assertIn("Blocks: 1 tasks", score_task(spec, task_list=dependents)[1])
+
+    def test_analyze_validates_before_saving(self):
+        """A bad item anywhere in the request saves nothing"""
+        payload = [
+            {"title": "Good", "due_date": "2030-01-15", "estimated_hours": 1, "importance": 5},
+            {"title": "Bad", "due_date": "15-01-2030", "estimated_hours": 1, "importance": 5},
+        ]
+        response = self.client.post('/api/tasks/analyze/', json.dumps(payload), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.exists())
+
+    def test_analyze_rejects_out_of_range_item_before_saving(self):
+        """Range and overdue checks run in the parsing pass, before any save"""
+        good = {"title": "Good", "due_date": "2030-01-15", "estimated_hours": 1, "importance": 5}
+        for bad in (
+            {"title": "Bad", "due_date": "2030-01-15", "estimated_hours": 1, "importance": 42},
+            {"title": "Bad", "due_date": "2030-01-15", "estimated_hours": 0, "importance": 5},
+            {"title": "Bad", "due_date": (date.today() - timedelta(days=31)).isoformat(),
+             "estimated_hours": 1, "importance": 5},
+        ):
+            response = self.client.post('/api/tasks/analyze/', json.dumps([good, bad]), content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+            self.assertFalse(Task.objects.exists())
+        response = self.client.post('/api/tasks/analyze/', json.dumps([good, {**good, "importance": 42}]),
+                                    content_type='application/json')
+        self.assertEqual(response.json()['error'], "Importance must be between 1 and 10.")
+
+    def test_analyze_rolls_back_on_duplicate(self):
+        """A duplicate later in the request undoes the items saved before it"""
+        existing = {"title": "Existing", "due_date": "2030-01-15", "estimated_hours": 1, "importance": 5}
+        self.client.post('/api/tasks/analyze/', json.dumps([existing]), content_type='application/json')
+        payload = [{"title": "New", "due_date": "2030-02-15", "estimated_hours": 2, "importance": 6}, existing]
+        response = self.client.post('/api/tasks/analyze/', json.dumps(payload), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(Task.objects.values_list('title', flat=True)), ["Existing"])
+
+
+class ConcurrentAnalyzeTestCase(TransactionTestCase):
+    """Concurrent /analyze/ writers queue for the SQLite write lock instead of failing"""
+
+    def test_concurrent_analyze_requests_all_succeed(self):
+        statuses = []
+
+        def post(i):
+            payload = [{"title": f"Concurrent {i}", "due_date": "2030-01-15", "estimated_hours": 1, "importance": 5}]
+            response = Client().post('/api/tasks/analyze/', json.dumps(payload), content_type='application/json')
+            statuses.append(response.status_code)
+            connection.close()
+
+        threads = [threading.Thread(target=post, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(statuses, [200] * 16)
+        self.assertEqual(Task.objects.count(), 16)
@@ -4,4 +4,8 @@ from . import views
 urlpatterns = [
     path('analyze/', views.task_list, name='task_list'),
     path('suggest/', views.suggest_tasks, name='suggest_tasks'),
+    path('export/', views.export_tasks, name='export_tasks'),
+    path('bulk/', views.bulk_update_tasks, name='bulk_update_tasks'),
+    path('<int:task_id>/', views.task_detail, name='task_detail'),
+    path('stats/', views.coalesce_stats, name='coalesce_stats'),
 ]
\ No newline at end of file
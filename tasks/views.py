@@ -1,11 +1,59 @@
 from django.views.decorators.csrf import csrf_exempt
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.db import OperationalError, transaction
 import json
 from .models import Task
-from .scoring import score_task
+from .scoring import score_components, rescore_task
+from .export import EXPORT_FORMATS, export_rows, iter_export, parse_date
+from .coalesce import coalesce, flight
+from .specs import parse_task_specs
+from .dependencies import dependency_ids
 from datetime import datetime
 # Create your views here.
 
+def _query_flag(request, name):
+    return request.GET.get(name) in ('1', 'true')
+
+
+def _create_tasks(specs, strategy, explain):
+    created_tasks = []
+    for spec in specs:
+        if Task.objects.filter(title=spec.title).exists():
+            if Task.objects.filter(importance=spec.importance,due_date=spec.due_date,estimated_hours=spec.estimated_hours,strategy=strategy).exists():
+                raise ValueError(f'Task with title "{spec.title}" and same parameters already exists.')
+
+        # Assumed multiple tasks can have same title, so not checking for existing titles
+        # Also when strategy is changed, it creates new tasks instead of updating existing ones.
+        score, components = score_components(spec, strategy=strategy, task_list=specs)
+
+        # Only now build the ORM instance, to persist it
+        temp_task = Task(
+            title=spec.title,
+            due_date=spec.due_date,
+            estimated_hours=spec.estimated_hours,
+            importance=spec.importance,
+            dependencies=spec.dependencies,
+            score=score,
+            strategy=strategy,
+        )
+        temp_task.set_explanation(components)
+        temp_task.save()
+
+        created_task = {
+            'id': temp_task.id,
+            'title': spec.title,
+            'due_date': str(spec.due_date),
+            'estimated_hours': spec.estimated_hours,
+            'importance': spec.importance,
+            'dependencies': spec.dependencies,
+            'score': float(score),
+        }
+        if explain:
+            created_task['explanation'] = temp_task.explanation or ""
+        created_tasks.append(created_task)
+    return created_tasks
+
+
 @csrf_exempt
 @csrf_exempt
 def task_list(request):
@@ -17,57 +65,28 @@ def task_list(request):
        return JsonResponse({"error": str(e)}, status=400)
     
     strategy=request.GET.get('strategy','smart_balance')
-    created_tasks = []
-    for task in tasks:
-            try:
-                if task['title']=='' or 'title' not in task:
-                    return JsonResponse({'error': 'Title is required field.'}, status=400)
-                
-                due_date=datetime.strptime(task["due_date"], "%Y-%m-%d").date()
-                title=task["title"]
-                estimated_hours=int(task["estimated_hours"])
-                importance=int(task["importance"])
-                dependencies=task.get("dependencies",[])
-
-                if title in [t.title for t in Task.objects.all()]:
-                    if Task.objects.filter(importance=importance,due_date=due_date,estimated_hours=estimated_hours,strategy=strategy).exists():
-                        return JsonResponse({'error': f'Task with title "{title}" and same parameters already exists.'}, status=400)
-
-                # Assumed multiple tasks can have same title, so not checking for existing titles
-                # Also when strategy is changed, it creates new tasks instead of updating existing ones.
-                temp_task = Task(
-                    title=title,
-                    due_date=due_date,
-                    estimated_hours=estimated_hours,
-                    importance=importance,
-                    dependencies=dependencies
-                )
-
-                score, explanation = score_task(temp_task, strategy=strategy, task_list=tasks)
-                temp_task.score = score
-                temp_task.explanation = explanation
-                temp_task.strategy = strategy
-                temp_task.save()
-
-                created_tasks.append({
-                    'id': temp_task.id,
-                    'title': title,
-                    'due_date': str(due_date),
-                    'estimated_hours': estimated_hours,
-                    'importance': importance,
-                    'dependencies': dependencies,
-                    'score': float(score),
-                    'explanation': explanation or "",
-                })
-            
-            except Exception as e:
-                 return JsonResponse({"error": str(e)}, status=400)
+    explain = _query_flag(request, 'explain')
+    try:
+        specs = parse_task_specs(tasks)
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    # Either every item is saved or none is; any exception rolls the batch back
+    try:
+        with transaction.atomic():
+            created_tasks = _create_tasks(specs, strategy, explain)
+    except OperationalError as e:
+        # Lock contention or another database failure, not a bad request
+        return JsonResponse({"error": str(e)}, status=503)
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
 
     #Return tasks as sorted list based on score
     sorted_tasks = sorted(created_tasks, key=lambda t: t['score'], reverse=True)
     return JsonResponse({'tasks': sorted_tasks},safe=False)   
         
 @csrf_exempt
+@coalesce
 def suggest_tasks(request):
     if request.method != 'GET':
         return JsonResponse({'error': 'Invalid request method.'}, status=405)
@@ -108,11 +127,179 @@ def suggest_tasks(request):
                 'importance': task.importance,
                 'dependencies': task.dependencies,
                 'score': task.score,
-                'explanation': task.explanation,
                 'strategy': task.strategy,
+                'task': task,
             })
     top3_suggestions = sorted(suggestions, key=lambda x: x['score'],reverse=True)[:3]
+    # Render explanations only for the tasks actually returned
+    explain = _query_flag(request, 'explain')
+    for suggestion in top3_suggestions:
+        task = suggestion.pop('task')
+        if explain:
+            suggestion['explanation'] = task.explanation
     return JsonResponse({'suggestions': top3_suggestions,'based_on':based_on})
 
-    
-    
+
+def export_tasks(request):
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Invalid request method.'}, status=405)
+
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': f'Format must be one of: {", ".join(EXPORT_FORMATS)}.'}, status=400)
+    try:
+        due_after = parse_date(request.GET.get('due_after'))
+        due_before = parse_date(request.GET.get('due_before'))
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    rows = export_rows(
+        strategy=request.GET.get('strategy'),
+        due_after=due_after,
+        due_before=due_before,
+        include_archived=_query_flag(request, 'include_archived'),
+    )
+    content_type = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    response = StreamingHttpResponse(iter_export(export_format, rows), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="tasks.{export_format}"'
+    return response
+
+
+def coalesce_stats(request):
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Invalid request method.'}, status=405)
+    return JsonResponse({'coalescing': flight.stats()})
+
+
+PATCHABLE_FIELDS = ('title', 'due_date', 'estimated_hours', 'importance', 'dependencies', 'strategy')
+# Fields that feed the task's own score; dependencies only affect its neighbors
+SCORING_FIELDS = ('due_date', 'estimated_hours', 'importance', 'strategy')
+
+
+def _task_to_dict(task, explain=False):
+    data = {
+        'id': task.id,
+        'title': task.title,
+        'due_date': str(task.due_date),
+        'estimated_hours': task.estimated_hours,
+        'importance': task.importance,
+        'dependencies': task.dependencies,
+        'score': float(task.score) if task.score is not None else None,
+        'strategy': task.strategy,
+    }
+    if explain:
+        data['explanation'] = task.explanation or ""
+    return data
+
+
+def _apply_changes(task, data):
+    # Returns the dependency ids added or removed, whose block counts change
+    for field in data:
+        if field != 'id' and field not in PATCHABLE_FIELDS:
+            raise ValueError(f'Unknown field "{field}".')
+    old_dependencies = set(task.dependencies or [])
+    if 'title' in data:
+        if not data['title']:
+            raise ValueError('Title is required field.')
+        task.title = data['title']
+    if 'due_date' in data:
+        task.due_date = datetime.strptime(data["due_date"], "%Y-%m-%d").date()
+    if 'estimated_hours' in data:
+        task.estimated_hours = int(data['estimated_hours'])
+    if 'importance' in data:
+        task.importance = int(data['importance'])
+    if 'dependencies' in data:
+        if not isinstance(data['dependencies'], list):
+            raise ValueError('Dependencies must be a list.')
+        task.dependencies = [str(dep) for dep in data['dependencies']]
+    if 'strategy' in data:
+        task.strategy = data['strategy']
+    return old_dependencies ^ set(task.dependencies or [])
+
+
+def _update_tasks(changes):
+    # Save every edit first so block counts see the final dependency lists
+    changed_dependencies = set()
+    for task, data in changes:
+        changed_dependencies |= _apply_changes(task, data)
+        task.save()
+
+    # Edits that don't touch a scoring input keep the stored score, so e.g.
+    # renaming a long-overdue task doesn't trip score validation
+    edited = {task.id: task for task, _ in changes}
+    rescored_ids = set()
+    for task, data in changes:
+        if any(field in data for field in SCORING_FIELDS):
+            rescore_task(task)
+            rescored_ids.add(task.id)
+
+    # Only tasks gaining or losing a dependent need a new smart_balance score
+    neighbor_ids = dependency_ids(changed_dependencies) - rescored_ids
+    neighbors = [edited[task_id] for task_id in neighbor_ids if task_id in edited]
+    neighbors += Task.objects.filter(id__in=neighbor_ids - edited.keys())
+    rescored = []
+    for neighbor in neighbors:
+        if neighbor.strategy != 'smart_balance':
+            continue
+        try:
+            rescore_task(neighbor)
+        except ValueError:
+            # Too far overdue to score; keep its stored score
+            continue
+        rescored.append(neighbor.id)
+    return sorted(rescored)
+
+
+@csrf_exempt
+def task_detail(request, task_id):
+    if request.method != 'PATCH':
+        return JsonResponse({'error': 'Invalid request method.'}, status=405)
+    try:
+        data = json.loads(request.body.decode('utf-8'))
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if not isinstance(data, dict):
+        return JsonResponse({'error': 'Request body must be an object.'}, status=400)
+    if 'id' in data and str(data['id']) != str(task_id):
+        return JsonResponse({'error': f'Body "id" does not match task {task_id} in the URL.'}, status=400)
+
+    try:
+        with transaction.atomic():
+            task = Task.objects.select_for_update().get(id=task_id)
+            rescored = _update_tasks([(task, data)])
+    except Task.DoesNotExist:
+        return JsonResponse({'error': f'Task {task_id} does not exist.'}, status=404)
+    except (KeyError, TypeError, ValueError) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse({'task': _task_to_dict(task, _query_flag(request, 'explain')), 'rescored': rescored})
+
+
+@csrf_exempt
+def bulk_update_tasks(request):
+    if request.method != 'PATCH':
+        return JsonResponse({'error': 'Invalid request method.'}, status=405)
+    try:
+        items = json.loads(request.body.decode('utf-8'))
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if not isinstance(items, list) or not all(isinstance(item, dict) and 'id' in item for item in items):
+        return JsonResponse({'error': 'Request body must be a list of objects with an "id".'}, status=400)
+    # Accept the same ids as the single-task route, which gets ints from the URL
+    try:
+        ids = [int(item['id']) for item in items]
+    except (TypeError, ValueError):
+        return JsonResponse({'error': 'Each "id" must be an integer.'}, status=400)
+
+    try:
+        with transaction.atomic():
+            tasks = Task.objects.select_for_update().in_bulk(ids)
+            missing = [task_id for task_id in ids if task_id not in tasks]
+            if missing:
+                return JsonResponse({'error': f'Tasks do not exist: {missing}'}, status=404)
+            changes = [(tasks[task_id], item) for task_id, item in zip(ids, items)]
+            rescored = _update_tasks(changes)
+    except (KeyError, TypeError, ValueError) as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    explain = _query_flag(request, 'explain')
+    return JsonResponse({'tasks': [_task_to_dict(task, explain) for task, _ in changes], 'rescored': rescored})
+